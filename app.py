@@ -199,11 +199,21 @@ def ensure_metadata_dir():
 
 def discover_tabs():
     modules = []
+    seen_ids = {}
 
     for _, module_name, _ in pkgutil.iter_modules(tabs.__path__):
         try:
             module = importlib.import_module(f"tabs.{module_name}")
             if hasattr(module, "TAB_META") and hasattr(module, "layout"):
+                # one module per TAB_META id → no duplicate layouts / callbacks
+                tab_id = module.TAB_META["id"]
+                if tab_id in seen_ids:
+                    print(
+                        f"[TAB LOAD ERROR] tabs.{module_name}: duplicate TAB_META id "
+                        f"'{tab_id}' (already defined by {seen_ids[tab_id]})"
+                    )
+                    continue
+                seen_ids[tab_id] = module.__name__
                 modules.append(module)
         except Exception as e:
             print(f"[TAB LOAD ERROR] tabs.{module_name}: {e}")
@@ -291,14 +301,36 @@ generate_metadata()
 # HELPERS: TAB REGISTRY (TYPE FILTERS)
 # ============================================================
 
+# Built once from TAB_MODULES (already sorted by order, stable) so the
+# bar / orchestrator callbacks do dict lookups instead of rescanning tabs.
+def _build_tab_index():
+    by_type = {}
+    by_wp = {}
+    by_category = {}
+
+    for m in TAB_MODULES:
+        tab_type = m.TAB_META.get("type")
+        by_type.setdefault(tab_type, []).append(m)
+
+        if tab_type != "service":
+            continue
+        for wp in dict.fromkeys(m.TAB_META.get("workpackages", []) or []):
+            by_wp.setdefault(wp, []).append(m)
+        for cat in dict.fromkeys(m.TAB_META.get("categories", []) or []):
+            by_category.setdefault(cat, []).append(m)
+
+    return tuple(
+        {k: tuple(v) for k, v in d.items()}
+        for d in (by_type, by_wp, by_category)
+    )
+
+
+_TABS_BY_TYPE, _SERVICES_BY_WP, _SERVICES_BY_CATEGORY = _build_tab_index()
+
+
 def tabs_by_type(tab_type: str):
     """Return tab modules whose TAB_META.type == tab_type, sorted by order."""
-    out = []
-    for m in TAB_MODULES:
-        if m.TAB_META.get("type") == tab_type:
-            out.append(m)
-    out.sort(key=lambda x: x.TAB_META.get("order", 999))
-    return out
+    return _TABS_BY_TYPE.get(tab_type, ())
 
 
 def get_wp_tabs():
@@ -321,14 +353,9 @@ def services_for_wp(wp_code: str):
     Return services that declare this WP in TAB_META['workpackages'].
     Example TAB_META['workpackages'] = ['WP4','WP5'].
     """
-    services = []
-    for m in get_service_tabs():
-        wps = m.TAB_META.get("workpackages", []) or []
-        if wp_code in wps:
-            services.append(m)
-    services.sort(key=lambda x: x.TAB_META.get("order", 999))
-    return services
-     
+    return _SERVICES_BY_WP.get(wp_code, ())
+
+
 def default_wp_id():
     wps = get_wp_tabs()
     if not wps:
@@ -371,14 +398,9 @@ def category_label_from_tab_id(cat_tab_id: str):
     return None   
      
 def services_for_category(category_name: str):
-    services = []
-    for m in get_service_tabs():
-        cats = m.TAB_META.get("categories", []) or []
-        if category_name in cats:
-            services.append(m)
-    services.sort(key=lambda x: x.TAB_META.get("order", 999))
-    return services
-    
+    return _SERVICES_BY_CATEGORY.get(category_name, ())
+
+
 # ============================================================
 # HELPERS: SCROLLABLE BAR RENDERING
 # ============================================================
@@ -0,0 +1,72 @@
+window.dash_clientside = Object.assign(
+  {},
+  window.dash_clientside,
+  {
+    gen: {
+      // Sinusoidal mode is generated in the browser; random mode stays server-side.
+      // Mirrors the "manual" branch of generate_synthetic_dataset().
+      // Returns [preview data, random-mode request]: random clicks only set the
+      // request store, which is the sole trigger of the server callback.
+      makeData: function (n, mode, freq, days, numSin, nmin, nmax, cmin, cmax) {
+        const noUpdate = window.dash_clientside.no_update;
+        const skip = [noUpdate, noUpdate];
+        if (mode !== "sinusoidal") return [noUpdate, n];
+
+        const params = [freq, days, numSin, nmin, nmax, cmin, cmax];
+        if (params.some((v) => v === null || v === undefined)) return skip;
+        // Point counts must be whole numbers (the Python generator rejects
+        // fractional ones too); never size an array from e.g. 24 * 1.5.
+        if (![freq, days, numSin].every(Number.isInteger)) return skip;
+
+        const PI = Math.PI;
+        const amps = [50, 40, 30, 25, 20, 15, 10, 8, 5, 3];
+        const phases = [0, PI / 6, PI / 4, PI / 3, PI / 2, PI, 3 * PI / 2, PI / 8, PI / 5, PI / 7];
+        const k = Math.min(numSin, amps.length);
+
+        const total = freq * days;
+        if (total <= 0) return skip;
+        const dtMs = (24 * 3600 * 1000) / freq;
+        const t0 = Date.UTC(2025, 0, 1);
+        const omegaBase = (2 * PI) / total;
+        const span = nmax - nmin;
+
+        const y = new Array(total);
+        for (let i = 0; i < total; i++) {
+          let v = nmin + Math.random() * span;
+          for (let j = 0; j < k; j++) {
+            v += amps[j] * Math.sin(omegaBase * (j + 1) * i + phases[j]);
+          }
+          y[i] = Math.min(Math.max(v, cmin), cmax);
+        }
+
+        return [{ y: y, n: total, t0_ms: t0, dt_ms: dtMs }, noUpdate];
+      },
+
+      // Stored {y, n, t0_ms, dt_ms} → preview figure (both modes).
+      renderFig: function (d, template) {
+        if (!d) return window.dash_clientside.no_update;
+
+        // Server payloads carry float32 values as base64; browser-built ones as a plain array.
+        let y = d.y;
+        if (d.y_b64) {
+          const bytes = Uint8Array.from(atob(d.y_b64), (c) => c.charCodeAt(0));
+          y = new Float32Array(bytes.buffer);
+        }
+
+        // Evenly spaced axis: let Plotly derive x from x0 + i * dx (ms on date axes).
+        const x0 = new Date(d.t0_ms).toISOString().slice(0, 23).replace("T", " ");
+
+        return {
+          data: [{ type: "scattergl", x0: x0, dx: d.dt_ms, y: y, mode: "lines" }],
+          layout: {
+            template: template,
+            title: { text: "Synthetic Dataset Preview" },
+            xaxis: { type: "date", title: { text: "Time" } },
+            yaxis: { title: { text: "Value" } },
+            uirevision: "gen-preview",
+          },
+        };
+      },
+    },
+  }
+);
@@ -0,0 +1,55 @@
+window.dash_clientside = Object.assign(
+  {},
+  window.dash_clientside,
+  {
+    tabmenu: {
+      // Hide / show the tab tool menu in the browser (no server round-trip).
+      // Returns [menu style, show-button style, menu-visible]; mirrors the
+      // former Python callback in tabs_core/tab_menu_renderers.py.
+      toggle: function (hideClicks, showClicks, visible) {
+        const dc = window.dash_clientside;
+        const triggered = dc.callback_context.triggered;
+        if (!triggered || !triggered.length) throw dc.PreventUpdate;
+
+        const triggerId = triggered[0].prop_id.split(".")[0];
+
+        if (triggerId.endsWith("menu-hide")) {
+          return [
+            {
+              visibility: "hidden",
+              opacity: 0,
+              pointerEvents: "none",
+              height: 0,
+              overflow: "hidden",
+            },
+            {
+              visibility: "visible",
+              opacity: 1,
+              pointerEvents: "auto",
+            },
+            false,
+          ];
+        }
+
+        if (triggerId.endsWith("menu-show")) {
+          return [
+            {
+              visibility: "visible",
+              opacity: 1,
+              pointerEvents: "auto",
+              height: "auto",
+            },
+            {
+              visibility: "hidden",
+              opacity: 0,
+              pointerEvents: "none",
+            },
+            true,
+          ];
+        }
+
+        throw dc.PreventUpdate;
+      },
+    },
+  }
+);
@@ -72,7 +72,7 @@ TAB_META = {
 def layout():
     return html.Div(
         "Placeholder for cable structure visualization.",
-        style={"padding": "20px"},
+        className="svc-placeholder",
     )
 
 
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+import hashlib
+import io
+import os
+import re
 import time
+import warnings
+from typing import TYPE_CHECKING
 import numpy as np
-import pandas as pd
 
-import shutil
+if TYPE_CHECKING:
+    import pandas as pd
+
 from dash import html, dcc, Input, Output, State, no_update
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import get_colorscale
 from utils.paths import PARTNER_DATA_DIR
 
 """
@@ -99,6 +109,7 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 CSV_PREFIX = "partner_cable_metrics"
 NUM_FILES = 5
 ROWS_PER_FILE = 60
+CSV_FLOAT_FORMAT = "%.6g"
 
 # Cable-relevant dummy metrics (common HV cable insulation / construction indicators)
 # (names are for demo; units are indicative)
@@ -112,15 +123,16 @@ CABLE_METRICS = [
 ]
 
 
-def _metric_keys() -> list[str]:
-    return [k for k, _ in CABLE_METRICS]
+_METRIC_KEYS = tuple(k for k, _ in CABLE_METRICS)
+_METRIC_LABELS = {k: lbl for k, lbl in CABLE_METRICS}
+
+
+def _metric_keys() -> tuple[str, ...]:
+    return _METRIC_KEYS
 
 
 def _metric_label(key: str) -> str:
-    for k, lbl in CABLE_METRICS:
-        if k == key:
-            return lbl
-    return key
+    return _METRIC_LABELS.get(key, key)
 
 
 def _get_tz_display() -> str:
@@ -147,254 +159,446 @@ def _get_tz_display() -> str:
 
     return f"{offset} ({season} | {tz_code})"
 
+
 def _csv_path(idx: int) -> Path:
     return PARTNER_DATA_DIR / f"{CSV_PREFIX}.{idx}.csv"
 
 
+_FILE_RE = re.compile(rf"{re.escape(CSV_PREFIX)}\.(\d+)\.csv$")
+
+
+def _list_files_sorted() -> list[tuple[int, Path]]:
+    """
+    Single directory scan: (index, path) pairs of the demo CSVs, sorted by index.
+    """
+    with os.scandir(DATA_DIR) as it:
+        return sorted(
+            (int(m.group(1)), Path(e.path))
+            for e in it
+            if (m := _FILE_RE.match(e.name))
+        )
+
+
+# Approximate bytes per CSV row for the dummy schema (epoch timestamp + 6 floats
+# written with CSV_FLOAT_FORMAT); used to estimate row counts from the file
+# size without reading it.
+_AVG_ROW_BYTES = 60
+_IO_BUFFER_SIZE = 1 << 18  # 256 KiB read/write buffer for the demo CSVs
+
+
+def _count_rows(path: Path) -> int:
+    rows = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(_IO_BUFFER_SIZE):
+            rows += chunk.count(b"\n")
+    return rows - 1  # minus header
+
+
+# Last rotation check: the latest file and the (DATA_DIR mtime, latest file
+# mtime + size) seen at that point. Creating/unlinking files bumps the
+# directory mtime, appending bumps the file mtime and size (size also covers
+# filesystems with coarse mtime ticks); if none moved, rotation is a no-op.
+_ROT_STATE = {"key": None, "latest": None}
+
+
+def _rotation_key(latest: Path | None) -> tuple[int, int, int] | None:
+    if latest is None:
+        return None
+    try:
+        st = latest.stat()
+        return (DATA_DIR.stat().st_mtime_ns, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _remember_rotation(latest: Path) -> None:
+    _ROT_STATE["latest"] = latest
+    _ROT_STATE["key"] = _rotation_key(latest)
+
+
 def _rotate_files_if_needed(max_rows_per_file: int = 100) -> None:
     """
     Keep files small:
     - We write to the "latest" file (highest index that exists, else 1).
-    - If it's above max_rows_per_file, we rotate (increment index up to NUM_FILES, then shift).
+    - If it's above max_rows_per_file, we rotate (write the next index, drop the oldest
+      file once NUM_FILES exist).
+    - Skipped entirely while nothing in DATA_DIR changed since the last check.
     """
+    key = _rotation_key(_ROT_STATE["latest"])
+    if key is not None and key == _ROT_STATE["key"]:
+        return
+
     # Determine current file index
-    existing = sorted(DATA_DIR.glob(f"{CSV_PREFIX}.*.csv"))
+    existing = _list_files_sorted()
     if not existing:
-        # create first file
-        df = _generate_dummy_frame(ROWS_PER_FILE)
-        df.to_csv(_csv_path(1), index=False)
+        # seed the whole rolling window from a single RNG draw
+        df_full = _generate_dummy_frame(NUM_FILES * ROWS_PER_FILE)
+        for i in range(NUM_FILES):
+            chunk = df_full.iloc[i * ROWS_PER_FILE:(i + 1) * ROWS_PER_FILE]
+            _write_csv(chunk, _csv_path(i + 1))
+        _remember_rotation(_csv_path(NUM_FILES))
         return
 
     # latest by numeric suffix
-    def _idx(p: Path) -> int:
-        try:
-            return int(p.stem.split(".")[-1])
-        except Exception:
-            return 1
+    latest_idx, latest = existing[-1]
 
-    existing = sorted(existing, key=_idx)
-    latest = existing[-1]
-    latest_idx = _idx(latest)
-
-    # If latest too large, rotate
+    # If latest too large, rotate (estimate from st_size; only count lines
+    # when the estimate lands within 10% of the threshold)
     try:
-        rows = sum(1 for _ in open(latest, "r", encoding="utf-8")) - 1  # minus header
+        rows = latest.stat().st_size // _AVG_ROW_BYTES
+        if abs(rows - max_rows_per_file) <= max_rows_per_file // 10:
+            rows = _count_rows(latest)
     except Exception:
         rows = max_rows_per_file + 1
 
     if rows <= max_rows_per_file:
+        _remember_rotation(latest)
         return
 
-    # rotation: if we already have NUM_FILES, shift down (2->1, 3->2, ...)
-    if latest_idx >= NUM_FILES:
-        # rotate DOWNWARDS to avoid overwrite (Windows-safe)
-        for i in range(NUM_FILES - 1, 0, -1):
-            src = _csv_path(i)
-            dst = _csv_path(i - 1)
-            if src.exists():
-                try:
-                    if dst.exists():
-                        dst.unlink()  # remove destination first
-                    shutil.move(src, dst)
-                except (PermissionError, FileExistsError, FileNotFoundError):
-                    return
-        # new latest becomes NUM_FILES
-        df = _generate_dummy_frame(ROWS_PER_FILE)
-        df.to_csv(_csv_path(NUM_FILES), index=False)
-    else:
-        # create next file
-        df = _generate_dummy_frame(ROWS_PER_FILE)
-        df.to_csv(_csv_path(latest_idx + 1), index=False)
+    # rotation: keep a rolling window of NUM_FILES by dropping the oldest
+    # file(s) and writing the next index; readers pick the top-N by index,
+    # so no file ever has to be renamed.
+    for _, stale in existing[: max(0, len(existing) - NUM_FILES + 1)]:
+        try:
+            os.unlink(stale)
+        except (PermissionError, FileNotFoundError):
+            return
 
+    df = _generate_dummy_frame(ROWS_PER_FILE)
+    _write_csv(df, _csv_path(latest_idx + 1))
+    _remember_rotation(_csv_path(latest_idx + 1))
 
-def _generate_dummy_frame(n: int) -> pd.DataFrame:
+
+def _generate_dummy_metrics(n: int) -> np.ndarray:
     """
     Generates cable-like dummy metrics with some realistic-ish ranges and correlations.
     Not meant to be physically exact; just plausible demo data.
+    Returns an (n, len(CABLE_METRICS)) array in CABLE_METRICS column order.
     """
     rng = np.random.default_rng()
 
-    insulation_thickness = rng.normal(25, 4, n).clip(12, 40)  # mm (e.g., HVDC ~20-30mm typical bands)
-    layers = rng.integers(3, 8, n)  # integer layers
+    # SoA: one contiguous float32 row per metric, filled in place
+    out = np.empty((len(CABLE_METRICS), n), dtype=np.float32)
+    insulation_thickness, layers, epsr, diel_strength, tan_delta, rho = out
+
+    # mm (e.g., HVDC ~20-30mm typical bands)
+    np.clip(_fill_normal(rng, insulation_thickness, 25, 4), 12, 40, out=insulation_thickness)
+    layers[:] = rng.integers(3, 8, n)  # integer layers (kept numeric for corr)
 
     # XLPE relative permittivity around ~2.4 (varies slightly)
-    epsr = rng.normal(2.4, 0.12, n).clip(2.0, 3.0)
+    np.clip(_fill_normal(rng, epsr, 2.4, 0.12), 2.0, 3.0, out=epsr)
 
     # dielectric strength kV/mm: loosely around 25-40 for XLPE-type insulation
-    diel_strength = (rng.normal(32, 4, n) + (epsr - 2.4) * (-6)).clip(18, 45)
+    _fill_normal(rng, diel_strength, 32, 4)
+    diel_strength -= (epsr - 2.4) * 6
+    np.clip(diel_strength, 18, 45, out=diel_strength)
 
     # tan delta: very small; we keep it small but allow some outliers
-    tan_delta = np.abs(rng.normal(3e-4, 2e-4, n)).clip(5e-5, 3e-3)
-
-    # volume resistivity: huge range; use log-normal
-    log_rho = rng.normal(16.5, 0.7, n)  # 10^16-ish order
-    rho = (10 ** log_rho).clip(1e12, 1e19)
-
-    df = pd.DataFrame(
-        {
-            "timestamp": [datetime.now().strftime("%Y-%m-%d %H:%M:%S")] * n,
-            "insulation_thickness_mm": insulation_thickness,
-            "insulation_layers": layers.astype(float),  # keep numeric for corr
-            "relative_permittivity_epsr": epsr,
-            "dielectric_strength_kv_per_mm": diel_strength,
-            "tan_delta": tan_delta,
-            "volume_resistivity_ohm_cm": rho,
-        }
-    )
+    np.abs(_fill_normal(rng, tan_delta, 3e-4, 2e-4), out=tan_delta)
+    np.clip(tan_delta, 5e-5, 3e-3, out=tan_delta)
+
+    # volume resistivity: huge range; use log-normal (10^16-ish order)
+    np.power(10, _fill_normal(rng, rho, 16.5, 0.7), out=rho)
+    np.clip(rho, 1e12, 1e19, out=rho)
+
+    return out.T
+
+
+def _fill_normal(rng: np.random.Generator, out: np.ndarray, mu: float, sigma: float) -> np.ndarray:
+    rng.standard_normal(dtype=np.float32, out=out)
+    out *= sigma
+    out += mu
+    return out
+
+
+def _generate_dummy_frame(n: int) -> pd.DataFrame:
+    # pandas is only needed on this (seed/fallback) write path; import it
+    # lazily so loading the tab does not pay for it.
+    import pandas as pd
+
+    df = pd.DataFrame(_generate_dummy_metrics(n), columns=_metric_keys(), copy=False)
+    # int64 epoch seconds: not consumed by the correlation, kept for provenance
+    df.insert(0, "timestamp", np.full(n, int(time.time()), dtype=np.int64))
     return df
 
 
-def _read_last_files(n_files: int = 2) -> pd.DataFrame:
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    # binary handle with a 1 MiB buffer: the whole file goes out in one write()
+    # "\n" on every OS, so _append_rows can match it byte for byte
+    with open(path, "wb", buffering=1 << 20) as f:
+        df.to_csv(f, index=False, float_format=CSV_FLOAT_FORMAT, lineterminator="\n")
+
+
+# Row template for the byte-level append path: same layout as _write_csv
+# (epoch-seconds timestamp, then the metric columns, "\n"-terminated).
+_ROW_TEMPLATE = ("%d," + ",".join([CSV_FLOAT_FORMAT] * len(CABLE_METRICS)) + "\n").encode()
+
+
+def _append_rows(path: Path, n: int) -> None:
     """
-    Read the last n_files (by index) and merge them.
+    Generate n dummy rows and append them to `path` as one bytes blob,
+    without building a DataFrame or going through a CSV writer.
     """
-    paths = sorted(DATA_DIR.glob(f"{CSV_PREFIX}.*.csv"))
-    if not paths:
-        return pd.DataFrame(columns=["timestamp"] + _metric_keys())
+    ts = int(time.time())
+    blob = b"".join(_ROW_TEMPLATE % (ts, *row) for row in _generate_dummy_metrics(n).tolist())
+    # single write() call: no user-space buffer needed
+    with open(path, "ab", buffering=0) as f:
+        f.write(blob)
+
+
+def _read_last_files(n_files: int = 2) -> tuple[tuple, np.ndarray]:
+    """
+    Read the last n_files (by index) and merge their metric columns.
+    Returns the files signature ((path, mtime_ns, size) per file, used as the
+    cache key) together with the merged (rows, len(CABLE_METRICS)) array.
+    """
+    paths = [p for _, p in _list_files_sorted()[-n_files:]]
+    try:
+        sig = tuple((str(p), st.st_mtime_ns, st.st_size) for p, st in ((p, p.stat()) for p in paths))
+    except OSError:
+        sig = ()
+    return sig, _read_last_files_cached(sig)
+
+
+# CSV columns holding the metrics (column 0 is the timestamp)
+_METRIC_COLS = tuple(range(1, len(CABLE_METRICS) + 1))
 
-    def _idx(p: Path) -> int:
-        try:
-            return int(p.stem.split(".")[-1])
-        except Exception:
-            return 0
 
-    paths = sorted(paths, key=_idx)[-n_files:]
-    frames = []
-    for p in paths:
+def _load_metric_rows(path: str) -> np.ndarray:
+    """
+    Parse the metric columns of one demo CSV straight from its bytes.
+    """
+    with open(path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+        body = f.read().partition(b"\n")[2]  # drop header
+    if not body.strip():
+        return np.empty((0, len(_METRIC_COLS)), dtype=np.float32)
+    try:
+        return np.loadtxt(io.BytesIO(body), delimiter=",", usecols=_METRIC_COLS, dtype=np.float32, ndmin=2)
+    except ValueError:
+        # Malformed / half-written row: keep the rest of the file, bad cells
+        # become NaN and are masked out by the caller.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return np.genfromtxt(
+                io.BytesIO(body), delimiter=",", usecols=_METRIC_COLS,
+                dtype=np.float32, invalid_raise=False, ndmin=2,
+            )
+
+
+@lru_cache(maxsize=8)
+def _read_last_files_cached(sig: tuple) -> np.ndarray:
+    # Only the metric columns matter for the correlation: parse just those
+    # as float32, stack them into one C-contiguous slab and drop NaN rows
+    # with a single mask at the end.
+    chunks = [np.empty((0, len(_METRIC_COLS)), dtype=np.float32)]
+    for path, _mtime_ns, _size in sig:
         try:
-            df = pd.read_csv(p)
-            frames.append(df)
+            chunks.append(_load_metric_rows(path))
         except Exception:
             continue
 
-    if not frames:
-        return pd.DataFrame(columns=["timestamp"] + _metric_keys())
+    out = np.vstack(chunks)
+    out = out[~np.isnan(out).any(axis=1)]
+    out.setflags(write=False)  # shared by every caller of the cache
+    return out
+
 
-    df_all = pd.concat(frames, ignore_index=True)
-    # clean: keep only numeric columns for corr (and drop nulls)
-    for k in _metric_keys():
-        df_all[k] = pd.to_numeric(df_all.get(k, np.nan), errors="coerce")
-    df_all = df_all.dropna(subset=_metric_keys(), how="any")
-    return df_all
+@lru_cache(maxsize=8)
+def _pearson_cached(sig: tuple, cols: tuple[str, ...]) -> np.ndarray | None:
+    """
+    Pearson correlation of `cols` over the files identified by `sig`
+    (None when there are fewer than two rows or columns).
+    """
+    data = _read_last_files_cached(sig)
+    if len(cols) < 2 or len(data) < 2:
+        return None
+    keys = _metric_keys()
+    slab = np.ascontiguousarray(data[:, [keys.index(c) for c in cols]])
+    # constant columns yield NaN cells (rendered blank), not warnings
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.corrcoef(slab, rowvar=False)
+
+
+def _append_chunk() -> None:
+    """
+    Rotate if needed, then append a new chunk to the latest file to simulate
+    a "fresh" partner dataset.
+    """
+    _rotate_files_if_needed(max_rows_per_file=100)
+    # Find latest file index; if none, rotation created it.
+    existing = _list_files_sorted()
+    if not existing:
+        return
+
+    _append_rows(existing[-1][1], ROWS_PER_FILE)
+
+
+# Single background writer for "Refresh Data": keeps CSV generation and disk
+# writes off the Dash worker while still serializing them.
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="partner-data-io")
+_IO_STATE = {"pending": None}
+
+
+def _wait_for_pending_write(timeout: float = 10.0) -> None:
+    pending = _IO_STATE["pending"]
+    if pending is None:
+        return
+    try:
+        pending.result(timeout=timeout)
+    except Exception:
+        # A failed/slow demo write should not break the heatmap render
+        pass
 
 
 # -----------------------------
 # Figures
 # -----------------------------
-def _make_pie_fig(seed: int | None = None) -> go.Figure:
-    rng = np.random.default_rng(seed)
-
-    labels = ["MQTT", "REST", "OPC UA", "IEC 61850 (mock)"]
-    values = rng.integers(10, 50, size=len(labels))
-    fig = go.Figure(
-        data=[
-            go.Pie(
-                labels=labels,
-                values=values,
-                hole=0.45,
-                textinfo="label+percent",
-            )
-        ]
-    )
-    fig.update_layout(
-        margin=dict(l=20, r=20, t=40, b=20),
-        height=320,
-        title="Protocol Share (Demo)",
-    )
-    return fig
-
-
-def _make_sankey_fig(seed: int | None = None) -> go.Figure:
-    rng = np.random.default_rng(seed)
+# Figures are built as plain plotly dicts (no go.Figure schema validation on
+# the server; plotly.js validates client-side). The default template and the
+# RdBu colorscale are resolved once so the rendering matches go.Figure output.
+_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+_RDBU = get_colorscale("RdBu")
+
+
+def _fig_layout(title: str, height: int) -> dict:
+    return {
+        "template": _TEMPLATE,
+        "margin": {"l": 20, "r": 20, "t": 40, "b": 20},
+        "height": height,
+        "title": {"text": title},
+    }
+
+
+# Everything except the data arrays is constant: the layouts and trace
+# skeletons are built once here and shared (never mutated) by every figure.
+_PIE_LAYOUT = _fig_layout("Protocol Share (Demo)", height=320)
+_SANKEY_LAYOUT = _fig_layout("Partner Data Flow (Demo)", height=320)
+_HEATMAP_LAYOUT = _fig_layout("Correlation Map (Demo)", height=420)
+
+_PIE_TRACE = {
+    "type": "pie",
+    "labels": ["MQTT", "REST", "OPC UA", "IEC 61850 (mock)"],
+    "hole": 0.45,
+    "textinfo": "label+percent",
+}
 
-    # Dummy "Partner Data Flow" - consistent with this tab
-    nodes = [
+# Dummy "Partner Data Flow" - consistent with this tab
+_SANKEY_NODE = {
+    "label": [
         "Devices",
         "Edge Gateway",
         "Partner API",
         "Data Lake",
         "Analytics",
         "Dashboard",
-    ]
-    # links: source->target with values
-    links = [
-        (0, 1, int(rng.integers(20, 60))),
-        (1, 2, int(rng.integers(10, 50))),
-        (2, 3, int(rng.integers(10, 50))),
-        (3, 4, int(rng.integers(10, 50))),
-        (4, 5, int(rng.integers(10, 50))),
-        (1, 5, int(rng.integers(5, 20))),  # bypass demo
-    ]
-    fig = go.Figure(
-        data=[
-            go.Sankey(
-                node=dict(
-                    label=nodes,
-                    pad=15,
-                    thickness=18,
-                ),
-                link=dict(
-                    source=[s for s, t, v in links],
-                    target=[t for s, t, v in links],
-                    value=[v for s, t, v in links],
-                ),
-            )
-        ]
-    )
-    fig.update_layout(
-        margin=dict(l=20, r=20, t=40, b=20),
-        height=320,
-        title="Partner Data Flow (Demo)",
-    )
-    return fig
+    ],
+    "pad": 15,
+    "thickness": 18,
+}
+# links: source->target, with per-link [low, high) bounds for the dummy values
+_SANKEY_LINKS = [
+    (0, 1),
+    (1, 2),
+    (2, 3),
+    (3, 4),
+    (4, 5),
+    (1, 5),  # bypass demo
+]
+_SANKEY_SOURCE = [s for s, t in _SANKEY_LINKS]
+_SANKEY_TARGET = [t for s, t in _SANKEY_LINKS]
+_SANKEY_LOWS = np.array([20, 10, 10, 10, 10, 5])
+_SANKEY_HIGHS = np.array([60, 50, 50, 50, 50, 20])
+
+_HEATMAP_TRACE = {
+    "type": "heatmap",
+    "zmin": -1,
+    "zmax": 1,
+    "colorscale": _RDBU,
+    "hovertemplate": "X: %{x}<br>Y: %{y}<br>Corr: %{z:.3f}<extra></extra>",
+}
 
 
-def _make_corr_heatmap(df: pd.DataFrame, order: list[str]) -> go.Figure:
-    # correlation only on selected metric columns
-    cols = [c for c in order if c in df.columns]
-    if len(cols) < 2 or df.empty:
-        # return empty-ish fig
-        fig = go.Figure()
-        fig.update_layout(
-            height=420,
-            margin=dict(l=20, r=20, t=40, b=20),
-            title="Correlation Map (Demo)",
-        )
-        return fig
+# One shared Philox bit generator; each demo seed is a cheap jumped
+# substream of it rather than a freshly seeded PCG64.
+_DEMO_BITGEN = np.random.Philox(seed=0)
 
-    corr = df[cols].corr(method="pearson")
 
-    # heatmap without text labels (hover shows value)
-    fig = go.Figure(
-        data=go.Heatmap(
-            z=corr.values,
-            x=[_metric_label(c) for c in corr.columns],
-            y=[_metric_label(c) for c in corr.index],
-            zmin=-1,
-            zmax=1,
-            colorscale="RdBu",
-            hovertemplate="X: %{x}<br>Y: %{y}<br>Corr: %{z:.3f}<extra></extra>",
-        )
-    )
-    fig.update_layout(
-        height=420,
-        margin=dict(l=20, r=20, t=40, b=20),
-        title="Correlation Map (Demo)",
-    )
-    return fig
+def _demo_rng(seed: int | None) -> np.random.Generator:
+    if seed is None:
+        return np.random.default_rng()
+    return np.random.Generator(_DEMO_BITGEN.jumped(seed))
+
+
+def _make_pie_fig(seed: int | None = None) -> dict:
+    rng = _demo_rng(seed)
 
+    values = rng.integers(10, 50, size=len(_PIE_TRACE["labels"]))
+    return {
+        "data": [{**_PIE_TRACE, "values": values.tolist()}],
+        "layout": _PIE_LAYOUT,
+    }
 
-def _dropdown_options(disable_key: str | None = None) -> list[dict]:
-    opts = []
-    for k, lbl in CABLE_METRICS:
-        opts.append(
+
+def _make_sankey_fig(seed: int | None = None) -> dict:
+    rng = _demo_rng(seed)
+
+    # one vectorized draw for all link values
+    vals = rng.integers(_SANKEY_LOWS, _SANKEY_HIGHS, dtype=np.int32).tolist()
+    return {
+        "data": [
             {
-                "label": lbl,
-                "value": k,
-                "disabled": (disable_key == k),
+                "type": "sankey",
+                "node": _SANKEY_NODE,
+                "link": {
+                    "source": _SANKEY_SOURCE,
+                    "target": _SANKEY_TARGET,
+                    "value": vals,
+                },
             }
-        )
-    return opts
+        ],
+        "layout": _SANKEY_LAYOUT,
+    }
+
+
+def _make_corr_heatmap(corr: np.ndarray | None, cols: list[str]) -> dict:
+    if corr is None:
+        # return empty-ish fig
+        return {"data": [], "layout": _HEATMAP_LAYOUT}
+
+    # heatmap without text labels (hover shows value)
+    labels = [_metric_label(c) for c in cols]
+    return {
+        "data": [{**_HEATMAP_TRACE, "z": corr.tolist(), "x": labels, "y": labels}],
+        "layout": _HEATMAP_LAYOUT,
+    }
+
+
+_BASE_OPTS = tuple({"label": lbl, "value": k, "disabled": False} for k, lbl in CABLE_METRICS)
+
+
+@lru_cache(maxsize=8)
+def _dropdown_options(disable_key: str | None = None) -> tuple[dict, ...]:
+    # Only len(CABLE_METRICS) + 1 distinct inputs exist, so the cache holds
+    # every possible result; unchanged option dicts are shared with _BASE_OPTS.
+    if disable_key is None:
+        return _BASE_OPTS
+    return tuple(
+        {**o, "disabled": True} if o["value"] == disable_key else o
+        for o in _BASE_OPTS
+    )
+
+
+# Initial figures are identical for every render; build them once at import
+# and reuse the dicts for every layout.
+_EMPTY_HEATMAP = _make_corr_heatmap(None, [])
+
+# Pre-warmed ring of seeded demo figures: refresh click n shows seed
+# (n % _FIG_POOL_SIZE) + 1, so callbacks only do a list lookup.
+_FIG_POOL_SIZE = 16
+_PIE_POOL = [_make_pie_fig(seed=i + 1) for i in range(_FIG_POOL_SIZE)]
+_SANKEY_POOL = [_make_sankey_fig(seed=i + 1) for i in range(_FIG_POOL_SIZE)]
+_PIE1 = _PIE_POOL[0]
+_SANKEY1 = _SANKEY_POOL[0]
 
 
 # -----------------------------
@@ -434,7 +638,7 @@ def layout():
                                 dbc.CardBody(
                                     dcc.Graph(
                                         id="partner-pie",
-                                        figure=_make_pie_fig(seed=1),
+                                        figure=_PIE1,
                                         config={"displayModeBar": False},
                                     )
                                 ),
@@ -450,7 +654,7 @@ def layout():
                                 dbc.CardBody(
                                     dcc.Graph(
                                         id="partner-sankey",
-                                        figure=_make_sankey_fig(seed=1),
+                                        figure=_SANKEY1,
                                         config={"displayModeBar": False},
                                     )
                                 ),
@@ -578,7 +782,7 @@ def layout():
                             html.Hr(),
                             dcc.Graph(
                                 id="corr-heatmap",
-                                figure=_make_corr_heatmap(pd.DataFrame(), order=_metric_keys()),
+                                figure=_EMPTY_HEATMAP,
                                 config={"displayModeBar": False},
                             ),
                             html.Div(
@@ -593,7 +797,9 @@ def layout():
 
             # Stores
             dcc.Store(id="partner-data-store"),
+            dcc.Store(id="partner-last-click", data=0),
             dcc.Store(id="corr-data-seed-store"),
+            dcc.Store(id="corr-sig-store"),
         ],
     )
 
@@ -606,12 +812,18 @@ def register_callbacks(app):
     @app.callback(
         Output("partner-pie", "figure"),
         Output("partner-sankey", "figure"),
+        Output("partner-last-click", "data"),
         Input("partner-refresh-btn", "n_clicks"),
+        State("partner-last-click", "data"),
         prevent_initial_call=False,
     )
-    def refresh_partner_charts(n):
-        seed = int(n or 0) + 1
-        return _make_pie_fig(seed=seed), _make_sankey_fig(seed=seed)
+    def refresh_partner_charts(n, last_n):
+        n = int(n or 0)
+        if n == int(last_n or 0):
+            # initial call / remount: the layout already shows these figures
+            return no_update, no_update, no_update
+        slot = n % _FIG_POOL_SIZE
+        return _PIE_POOL[slot], _SANKEY_POOL[slot], n
 
     # Dummy device info refresh
     @app.callback(
@@ -655,52 +867,52 @@ def register_callbacks(app):
     @app.callback(
         Output("corr-data-seed-store", "data"),
         Input("corr-refresh-btn", "n_clicks"),
-        prevent_initial_call=False,
+        prevent_initial_call=True,
     )
     def refresh_corr_data(_):
-        _rotate_files_if_needed(max_rows_per_file=100)
-        # Append a new chunk to the latest file to simulate "fresh" partner dataset
-        # Find latest file index; if none, rotation created it.
-        paths = sorted(DATA_DIR.glob(f"{CSV_PREFIX}.*.csv"))
-        if not paths:
-            return {"ok": True, "ts": datetime.now().isoformat()}
-
-        def _idx(p: Path) -> int:
-            try:
-                return int(p.stem.split(".")[-1])
-            except Exception:
-                return 1
-
-        latest = sorted(paths, key=_idx)[-1]
-        df_new = _generate_dummy_frame(ROWS_PER_FILE)
-        df_new.to_csv(latest, mode="a", header=False, index=False)
+        # Generate + write happens on the background writer; the worker
+        # returns immediately and show_corr waits for the write to land.
+        _IO_STATE["pending"] = _IO_POOL.submit(_append_chunk)
         return {"ok": True, "ts": datetime.now().isoformat()}
 
     # Show correlation heatmap
     @app.callback(
         Output("corr-heatmap", "figure"),
+        Output("corr-sig-store", "data"),
         Input("corr-show-btn", "n_clicks"),
         State("corr-metric-a", "value"),
         State("corr-metric-b", "value"),
         State("corr-data-seed-store", "data"),
-        prevent_initial_call=False,
+        State("corr-sig-store", "data"),
+        prevent_initial_call=True,
     )
-    def show_corr(n, metric_a, metric_b, _seed_state):
+    def show_corr(n, metric_a, metric_b, _seed_state, shown_sig):
+        _wait_for_pending_write()
+
         # Always ensure we have some data
         _rotate_files_if_needed(max_rows_per_file=100)
 
-        df_all = _read_last_files(n_files=2)
+        sig, data = _read_last_files(n_files=2)
 
         # If still empty, generate one file and re-read
-        if df_all.empty:
+        if len(data) == 0:
             df = _generate_dummy_frame(ROWS_PER_FILE)
-            df.to_csv(_csv_path(1), index=False)
-            df_all = _read_last_files(n_files=2)
+            _write_csv(df, _csv_path(1))
+            sig, data = _read_last_files(n_files=2)
 
         # Build order: selected A, selected B, then the rest
         all_keys = _metric_keys()
         metric_a = metric_a or all_keys[0]
         metric_b = metric_b or all_keys[1]
         order = [metric_a, metric_b] + [k for k in all_keys if k not in (metric_a, metric_b)]
+        # correlation only on known metric columns
+        cols = tuple(c for c in order if c in all_keys)
+
+        # Same files (paths + mtime_ns + size) and same metric order as the
+        # figure already on the client: nothing to send. Only a digest of the
+        # signature goes to the browser, never the server-side paths.
+        cur_sig = hashlib.blake2b(repr((sig, cols)).encode(), digest_size=16).hexdigest()
+        if cur_sig == shown_sig:
+            return no_update, no_update
 
-        return _make_corr_heatmap(df_all, order=order)
\ No newline at end of file
+        return _make_corr_heatmap(_pearson_cached(sig, cols), list(cols)), cur_sig
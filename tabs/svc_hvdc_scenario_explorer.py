@@ -1,7 +1,7 @@
 """Synthetic Data Generator Tab — full UI and callbacks."""
-from dash import html, dcc, Input, Output, State
-import plotly.graph_objects as go
-from logic.synthetic_dataset_generator import generate_synthetic_dataset
+import base64
+from dash import html, dcc, Input, Output, State, ClientsideFunction
+import plotly.io as pio
 
 """
 HVDC Scenario & Stress Exploration Tool
@@ -75,6 +75,81 @@ TAB_META = {
     "status": "active",
 }
 
+def _generate(mode, freq, days, num_sin, amp, dc, nmin, nmax, cmin, cmax):
+    """Run the generator for one Generate click.
+
+    Not memoised: the generator is random (noise term in every mode) and
+    saves the dataset to disk on each call, so each click must run it.
+    """
+    # The generator pulls in pandas; import it on first Generate rather than
+    # when the tab module is loaded.
+    from logic.synthetic_dataset_generator import generate_synthetic_dataset
+
+    return generate_synthetic_dataset(
+        mode=mode,
+        frequency_per_day=freq,
+        duration_days=days,
+        num_sinusoids=num_sin,
+        max_amplitude=amp,
+        max_dc_offset=dc,
+        noise_min=nmin,
+        noise_max=nmax,
+        clip_min=cmin,
+        clip_max=cmax,
+    )
+
+
+def _build_payload(mode, freq, days, num_sin, amp, dc, nmin, nmax, cmin, cmax):
+    """Preview vectors for the clientside renderer.
+
+    Values go out as base64 little-endian float32; the evenly spaced time axis
+    is reduced to its start and step (ms since epoch, naive timestamps).
+    """
+    df = _generate(mode, freq, days, num_sin, amp, dc, nmin, nmax, cmin, cmax)
+    ts = df["timestamp"]
+    y = df["value"].to_numpy(dtype="<f4")
+    return {
+        "y_b64": base64.b64encode(y.tobytes()).decode("ascii"),
+        "n": int(y.size),
+        "t0_ms": ts.iloc[0].value // 1_000_000,
+        "dt_ms": (ts.iloc[1] - ts.iloc[0]).total_seconds() * 1000 if len(ts) > 1 else 0,
+    }
+
+
+# Resolved once and shipped to the browser, which builds the preview figure.
+_FIG_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+
+# (label, ((input id, default value), ...)) – one row per label
+_INPUT_SPECS = (
+    ("Number of points:", (("gen-num-points", 500),)),
+    ("Frequency per day:", (("gen-freq-per-day", 24),)),
+    ("Duration (days):", (("gen-duration-days", 30),)),
+    ("Num sinusoids:", (("gen-num-sinusoids", 6),)),
+    ("Max amplitude:", (("gen-max-amp", 40),)),
+    ("Max DC offset:", (("gen-max-dc", 10),)),
+    ("Noise range (min/max):", (("gen-noise-min", -5), ("gen-noise-max", 20))),
+    ("Clip range (min/max):", (("gen-clip-min", -50), ("gen-clip-max", 150))),
+)
+
+
+def _control_children():
+    children = []
+    for label, inputs in _INPUT_SPECS:
+        children.append(html.Label(label))
+        width = "120px" if len(inputs) == 1 else "80px"
+        for i, (input_id, value) in enumerate(inputs):
+            style = {"width": width}
+            if i:
+                style["marginLeft"] = "6px"
+            children.append(dcc.Input(id=input_id, type="number", value=value, style=style))
+        children.append(html.Br())
+    return children
+
+
+_CONTROL_CHILDREN = _control_children()
+
+
 def layout():
     """Layout for Synthetic Data Generator tab."""
     return html.Div(
@@ -96,32 +171,7 @@ def layout():
                         style={"width": "200px"},
                     ),
                     html.Br(),
-                    html.Label("Number of points:"),
-                    dcc.Input(id="gen-num-points", type="number", value=500, style={"width": "120px"}),
-                    html.Br(),
-                    html.Label("Frequency per day:"),
-                    dcc.Input(id="gen-freq-per-day", type="number", value=24, style={"width": "120px"}),
-                    html.Br(),
-                    html.Label("Duration (days):"),
-                    dcc.Input(id="gen-duration-days", type="number", value=30, style={"width": "120px"}),
-                    html.Br(),
-                    html.Label("Num sinusoids:"),
-                    dcc.Input(id="gen-num-sinusoids", type="number", value=6, style={"width": "120px"}),
-                    html.Br(),
-                    html.Label("Max amplitude:"),
-                    dcc.Input(id="gen-max-amp", type="number", value=40, style={"width": "120px"}),
-                    html.Br(),
-                    html.Label("Max DC offset:"),
-                    dcc.Input(id="gen-max-dc", type="number", value=10, style={"width": "120px"}),
-                    html.Br(),
-                    html.Label("Noise range (min/max):"),
-                    dcc.Input(id="gen-noise-min", type="number", value=-5, style={"width": "80px"}),
-                    dcc.Input(id="gen-noise-max", type="number", value=20, style={"width": "80px", "marginLeft": "6px"}),
-                    html.Br(),
-                    html.Label("Clip range (min/max):"),
-                    dcc.Input(id="gen-clip-min", type="number", value=-50, style={"width": "80px"}),
-                    dcc.Input(id="gen-clip-max", type="number", value=150, style={"width": "80px", "marginLeft": "6px"}),
-                    html.Br(),
+                    *_CONTROL_CHILDREN,
                     html.Button("Generate", id="gen-generate-btn", n_clicks=0, style={"marginTop": "10px"}),
                     dcc.Checklist(
                         id="gen-auto-update",
@@ -134,7 +184,18 @@ def layout():
             ),
 
             # Output chart
-            dcc.Graph(id="gen-dataset-graph", style={"height": "400px"}),
+            dcc.Graph(
+                id="gen-dataset-graph",
+                config={"responsive": True},
+                animate=False,
+                style={"height": "400px"},
+            ),
+
+            # Preview data (x/y) and Plotly template for the clientside renderer
+            dcc.Store(id="gen-data-store"),
+            # Set by the browser only for random-mode clicks → server build
+            dcc.Store(id="gen-random-request"),
+            dcc.Store(id="gen-fig-template", data=_FIG_TEMPLATE),
         ],
         style={"padding": "20px"},
     )
@@ -143,36 +204,53 @@ def layout():
 def register_callbacks(app):
     """Register callbacks for Synthetic Data Generator tab."""
 
-    @app.callback(
-        Output("gen-dataset-graph", "figure"),
+    # Sinusoidal mode: data is built in assets/scenario_explorer.js,
+    # no server round-trip. Random mode: the click is forwarded through
+    # gen-random-request, the only trigger of the server callback below.
+    app.clientside_callback(
+        ClientsideFunction(namespace="gen", function_name="makeData"),
+        Output("gen-data-store", "data", allow_duplicate=True),
+        Output("gen-random-request", "data"),
         Input("gen-generate-btn", "n_clicks"),
         State("gen-mode-dropdown", "value"),
         State("gen-freq-per-day", "value"),
         State("gen-duration-days", "value"),
         State("gen-num-sinusoids", "value"),
+        State("gen-noise-min", "value"),
+        State("gen-noise-max", "value"),
+        State("gen-clip-min", "value"),
+        State("gen-clip-max", "value"),
+        prevent_initial_call=True,
+    )
+
+    # Both modes: the figure is assembled from the stored vectors in the browser.
+    app.clientside_callback(
+        ClientsideFunction(namespace="gen", function_name="renderFig"),
+        Output("gen-dataset-graph", "figure"),
+        Input("gen-data-store", "data"),
+        State("gen-fig-template", "data"),
+        prevent_initial_call=True,
+    )
+
+    @app.callback(
+        Output("gen-data-store", "data"),
+        Input("gen-random-request", "data"),
+        State("gen-mode-dropdown", "value"),
+        State("gen-freq-per-day", "value"),
+        State("gen-duration-days", "value"),
+        State("gen-num-sinusoids", "value"),
         State("gen-max-amp", "value"),
         State("gen-max-dc", "value"),
         State("gen-noise-min", "value"),
         State("gen-noise-max", "value"),
         State("gen-clip-min", "value"),
         State("gen-clip-max", "value"),
+        # Block re-clicks while a build is in flight so stale requests
+        # never queue up behind the current one.
+        running=[(Output("gen-generate-btn", "disabled"), True, False)],
         prevent_initial_call=True,
     )
     def generate_dataset(
-        n, mode, freq, days, num_sin, amp, dc, nmin, nmax, cmin, cmax
+        _request, mode, freq, days, num_sin, amp, dc, nmin, nmax, cmin, cmax
     ):
-        df = generate_synthetic_dataset(
-            mode=mode,
-            frequency_per_day=freq,
-            duration_days=days,
-            num_sinusoids=num_sin,
-            max_amplitude=amp,
-            max_dc_offset=dc,
-            noise_min=nmin,
-            noise_max=nmax,
-            clip_min=cmin,
-            clip_max=cmax,
-        )
-        fig = go.Figure(go.Scatter(x=df["timestamp"], y=df["value"], mode="lines"))
-        fig.update_layout(title="Synthetic Dataset Preview", xaxis_title="Time", yaxis_title="Value")
-        return fig
+        return _build_payload(mode, freq, days, num_sin, amp, dc, nmin, nmax, cmin, cmax)
@@ -1,4 +1,5 @@
-from dash import html, dcc, Input, Output, State, callback_context
+from dash import html, dcc, Input, Output, State, ctx
+from dash.exceptions import PreventUpdate
 # ============================================================
 # TAB META (UNCHANGED – for orchestrator only)
 # ============================================================
@@ -35,19 +36,27 @@ TAB_MENU_META = {
 
 TAB_PREFIX = "svc-lifecycle"
 
+# DOM ids derived from TAB_PREFIX (fixed at import)
+_ID_SHELL = f"{TAB_PREFIX}-tab-tool-menu-container-shell"
+_ID_MENU = f"{TAB_PREFIX}-menu"
+_ID_HIDE = f"{TAB_PREFIX}-menu-hide"
+_ID_SHOW = f"{TAB_PREFIX}-menu-show"
+_ID_VIS = f"{TAB_PREFIX}-menu-visible"
+_ID_WRAP = f"{TAB_PREFIX}-menu-show-wrapper"
+
 # ============================================================
 # REUSABLE RENDERERS (LOCAL)
 # ============================================================
 
 def render_tab_menu(menu_meta):
     return html.Div(
-        id=f"{TAB_PREFIX}-tab-tool-menu-container-shell",
+        id=_ID_SHELL,
         className="tab-tool-menu-container",
         children=[
-            dcc.Store(id=f"{TAB_PREFIX}-menu-visible", data=True),
+            dcc.Store(id=_ID_VIS, data=True),
 
             html.Div(
-                id=f"{TAB_PREFIX}-menu",
+                id=_ID_MENU,
                 className="tab-tool-menu",
                 children=[
                     *[
@@ -67,14 +76,14 @@ def render_tab_menu(menu_meta):
                                 className="tab-menu-icon",
                             ),
                         ),
-                        id=f"{TAB_PREFIX}-menu-hide",
+                        id=_ID_HIDE,
                         className="tab-tool-menu-hide",
                     ),
                 ],
             ),
 
             html.Div(
-                id=f"{TAB_PREFIX}-menu-show-wrapper",   # ⬅️ ΤΟ ΚΡΙΣΙΜΟ
+                id=_ID_WRAP,   # ⬅️ ΤΟ ΚΡΙΣΙΜΟ
                 className="tab-tool-menu-show-wrapper",
                 children=html.Button(
                     html.Img(
@@ -82,7 +91,7 @@ def render_tab_menu(menu_meta):
                         alt="Show menu",
                         className="tab-menu-icon",
                     ),
-                    id=f"{TAB_PREFIX}-menu-show",
+                    id=_ID_SHOW,
                     className="tab-tool-menu-collapsed",
                     style={"display": "none"},
                 ),
@@ -161,58 +170,59 @@ def layout():
 # CALLBACKS (HIDE / SHOW ONLY – NO APP COUPLING)
 # ============================================================
 
+# (menu style, show-button style, menu-visible)
+_HIDE_RESPONSE = (
+    {
+        "visibility": "hidden",
+        "opacity": 0,
+        "pointerEvents": "none",
+        "height": 0,
+        "overflow": "hidden",
+    },
+    {
+        "visibility": "visible",
+        "opacity": 1,
+        "pointerEvents": "auto",
+    },
+    False,
+)
+
+_SHOW_RESPONSE = (
+    {
+        "visibility": "visible",
+        "opacity": 1,
+        "pointerEvents": "auto",
+        "height": "auto",
+    },
+    {
+        "visibility": "hidden",
+        "opacity": 0,
+        "pointerEvents": "none",
+    },
+    True,
+)
+
+_TOGGLE_RESPONSES = {
+    _ID_HIDE: _HIDE_RESPONSE,
+    _ID_SHOW: _SHOW_RESPONSE,
+}
+
+
 def register_callbacks(app):
 
     @app.callback(
-        Output(f"{TAB_PREFIX}-menu", "style"),
-        Output(f"{TAB_PREFIX}-menu-show", "style"),
-        Output(f"{TAB_PREFIX}-menu-visible", "data"),
-        Input(f"{TAB_PREFIX}-menu-hide", "n_clicks"),
-        Input(f"{TAB_PREFIX}-menu-show", "n_clicks"),
-        State(f"{TAB_PREFIX}-menu-visible", "data"),
+        Output(_ID_MENU, "style"),
+        Output(_ID_SHOW, "style"),
+        Output(_ID_VIS, "data"),
+        Input(_ID_HIDE, "n_clicks"),
+        Input(_ID_SHOW, "n_clicks"),
+        State(_ID_VIS, "data"),
         prevent_initial_call=True,
     )
     def toggle_menu(hide_clicks, show_clicks, visible):
-        ctx = callback_context
-        if not ctx.triggered:
-            raise PreventUpdate
-        
-        trigger = ctx.triggered[0]["prop_id"].split(".")[0]
-        
-        if trigger.endswith("menu-hide"):
-            # return {"display": "none"}, {"display": "block"}, False
-            return (
-                {
-                "visibility": "hidden",
-                "opacity": 0,
-                "pointerEvents": "none",
-                "height": 0,
-                "overflow": "hidden",
-                },
-                {
-                "visibility": "visible",
-                "opacity": 1,
-                "pointerEvents": "auto",
-                },
-                False,
-                )
-        
-        if trigger.endswith("menu-show"):
-            # return {"display": "block"}, {"display": "none"}, True
-            return (
-                {
-                    "visibility": "visible",
-                    "opacity": 1,
-                    "pointerEvents": "auto",
-                    "height": "auto",
-                },
-                {
-                    "visibility": "hidden",
-                    "opacity": 0,
-                    "pointerEvents": "none",
-                },
-                True,
-            )
-        
+        response = _TOGGLE_RESPONSES.get(ctx.triggered_id)
+        if response is not None:
+            return response
+
         raise PreventUpdate
 
@@ -1,4 +1,6 @@
 from dash import html
+
+from tabs_core.tab_types import TabMeta
 """
 Service Topology & Runtime Overview Tool
 
@@ -40,37 +42,37 @@ Project context:
 #   - (not defined yet – leave empty)
 # ---------------------------------------------------------------------
 
-TAB_META = {
-    "id": "svc-service-topology",
+TAB_META = TabMeta(
+    id="svc-service-topology",
 
-    "label": "Service Topology & Runtime Overview",
+    label="Service Topology & Runtime Overview",
 
-    "type": "service",
+    type="service",
 
     # χαμηλό relative priority – δεν είναι primary analytic tool
-    "order": 240,
+    order=240,
 
     # Συνδέεται κυρίως με integration, validation και demo
-    "workpackages": ["WP1", "WP5", "WP6"],
+    workpackages=("WP1", "WP5", "WP6"),
 
     # Καθαρό platform awareness tool
-    "categories": [
+    categories=(
         "Cable System Awareness",
-    ],
+    ),
 
-    "subcategories": [],
+    subcategories=(),
 
     # Functions intentionally not defined yet
-    # "functions": [],
+    # functions=(),
 
-    "version": "v0.1 (demo)",
-    "status": "active",
-}
+    version="v0.1 (demo)",
+    status="active",
+)
 
 def layout():
     return html.Div(
         "Placeholder for Microservices Dashboard.",
-        style={"padding": "20px"},
+        className="svc-placeholder",
     )
 
 
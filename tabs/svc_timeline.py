@@ -3,34 +3,35 @@ Data Timeline Viewer Tab
 Uses tab_menu_template (implicit menu_layout)
 """
 
-from dash import html
+from types import MappingProxyType
 
-from tabs_core.menu_layout import menu_layout
-from tabs_core.tab_menu_renderers import register_tab_menu_callbacks
+from dash import html, dcc, Input, Output, State, no_update
 
-from tabs_core.interactive_timeline_core import (
-    get_tab,
-    register_callbacks as interactive_register,
+from tabs_core.menu_layout import menu_layout
+from tabs_core.tab_types import TabMeta
+from tabs_core.tab_menu_renderers import (
+    claim_callback_prefix,
+    register_tab_menu_callbacks,
 )
 
 # ============================================================
 # TAB META (for orchestrator)
 # ============================================================
 
-TAB_META = {
-    "id": "svc-hvdc-data-timeline",
-    "label": "Data Timeline Viewer",
-    "type": "service",
-    "order": 230,
-    "workpackages": ["WP4", "WP5", "WP6"],
-    "categories": [
+TAB_META = TabMeta(
+    id="svc-hvdc-data-timeline",
+    label="Data Timeline Viewer",
+    type="service",
+    order=230,
+    workpackages=("WP4", "WP5", "WP6"),
+    categories=(
         "Monitoring & Analytics",
         "Cable System Awareness",
-    ],
-    "subcategories": [],
-    "version": "v0.1 (demo)",
-    "status": "active",
-}
+    ),
+    subcategories=(),
+    version="v0.1 (demo)",
+    status="active",
+)
 
 # ============================================================
 # TAB CONFIG (REQUIRED BY menu_layout)
@@ -38,14 +39,18 @@ TAB_META = {
 
 TAB_PREFIX = "svc-hvdc-data-timeline"
 
-TAB_MENU_META = {
+# Component ids (shared by layout and callbacks)
+TIMELINE_CONTAINER_ID = f"{TAB_PREFIX}-timeline-container"
+TIMELINE_MOUNTED_ID = f"{TAB_PREFIX}-timeline-mounted"
+
+TAB_MENU_META = MappingProxyType({
     "default": "overview",
-    "items": [
-        {"id": "overview", "label": "Overview"},
-        {"id": "timeline", "label": "Timeline"},
-        {"id": "details", "label": "Details"},
-    ],
-}
+    "items": (
+        MappingProxyType({"id": "overview", "label": "Overview"}),
+        MappingProxyType({"id": "timeline", "label": "Timeline"}),
+        MappingProxyType({"id": "details", "label": "Details"}),
+    ),
+})
 
 # ============================================================
 # TAB CONTENT (REQUIRED BY menu_layout)
@@ -55,14 +60,23 @@ def layout_content():
     """
     Main content for the timeline tab.
     menu_layout() will wrap this automatically.
+
+    The timeline itself is NOT built here: the container starts empty and is
+    filled by a callback the first time this tab is selected.
     """
     return [
-        html.Div(
-            id=f"{TAB_PREFIX}-timeline-container",
-            children=get_tab(),
-        )
+        dcc.Store(id=TIMELINE_MOUNTED_ID, data=False),
+        html.Div(id=TIMELINE_CONTAINER_ID),
     ]
 
+
+def _timeline_tab():
+    # get_tab() builds the full timeline tree; only called from mount_timeline,
+    # i.e. the first time this tab is selected.
+    from tabs_core.interactive_timeline_core import get_tab
+
+    return get_tab()
+
 # ============================================================
 # LAYOUT
 # ============================================================
@@ -75,7 +89,27 @@ def layout():
 # ============================================================
 
 def register_callbacks(app):
-    # timeline interactive callbacks
+    if not claim_callback_prefix(app, TAB_PREFIX):
+        return
+
+    # deferred mount: build the timeline on first selection of this tab
+    @app.callback(
+        Output(TIMELINE_CONTAINER_ID, "children"),
+        Output(TIMELINE_MOUNTED_ID, "data"),
+        Input("selected-tool-store", "data"),   # Declared @ app.py
+        State(TIMELINE_MOUNTED_ID, "data"),
+    )
+    def mount_timeline(selected_tool, mounted):
+        if mounted or selected_tool != TAB_META.id:
+            return no_update, no_update
+        return _timeline_tab(), True
+
+    # timeline interactive callbacks (loads the timeline core at startup:
+    # callbacks must be registered before the app starts serving)
+    from tabs_core.interactive_timeline_core import (
+        register_callbacks as interactive_register,
+    )
+
     interactive_register(app)
 
     # tab menu hide / show callbacks
@@ -1,6 +1,8 @@
 from dash import html, dcc, ClientsideFunction
 from dash.dependencies import Input, Output
 
+from tabs_core.tab_types import TabMeta
+
 """
 WP4 Overview Tool (Service Tab)
 
@@ -32,27 +34,27 @@ Platform role:
 #   - (not defined – overview/context tool)
 # ---------------------------------------------------------------------
 
-TAB_META = {
-    "id": "svc-wp4-overview",
+TAB_META = TabMeta(
+    id="svc-wp4-overview",
 
-    "label": "WP4 – Monitoring & Diagnostics Overview",
+    label="WP4 – Monitoring & Diagnostics Overview",
 
-    "type": "service",
-    "order": 190,
+    type="service",
+    order=190,
 
     # This overview is strictly tied to WP4
-    "workpackages": ["WP4"],
+    workpackages=("WP4",),
 
     # Intentionally empty: this tool does not belong to a category
-    "categories": [],
+    categories=(),
 
-    "subcategories": [],
+    subcategories=(),
 
-    "version": "v0.1 (overview)",
-    "status": "active"
-}
+    version="v0.1 (overview)",
+    status="active",
+)
 
-SERVICE_ID = TAB_META["id"]
+SERVICE_ID = TAB_META.id
 
 def sid(suffix: str) -> str:
     return f"{SERVICE_ID}-{suffix}"
@@ -58,6 +58,20 @@ def _generate_df(duration_days: int = 365 * 10):
     )
 
 
+HOVER_PLACEHOLDER = "Hover over a point or bar to see details."
+
+
+def _empty_subset_figure():
+    """Placeholder for the brushed-subset graph before any selection."""
+    return go.Figure(
+        layout=dict(
+            title="Select a range in the timeline above",
+            xaxis_title="Date",
+            yaxis_title="Signal Amplitude",
+        )
+    )
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -172,6 +186,7 @@ def get_tab():
 
                     # Hover Feedback
                     html.Div(
+                        HOVER_PLACEHOLDER,
                         id="it-hover-info",
                         style={
                             "marginTop": "10px",
@@ -181,7 +196,11 @@ def get_tab():
                     ),
 
                     # Subset Graph (Brush Selection)
-                    dcc.Graph(id="it-subset", style={"height": "300px"}),
+                    dcc.Graph(
+                        id="it-subset",
+                        figure=_empty_subset_figure(),
+                        style={"height": "300px"},
+                    ),
                 ],
                 style={"padding": "20px"},
             )
@@ -194,7 +213,11 @@ def get_tab():
 # ---------------------------------------------------------------------------
 
 def register_callbacks(app: dash.Dash):
-    """Register callbacks for the interactive timeline tab."""
+    """Register callbacks for the interactive timeline tab.
+
+    All callbacks skip the initial call: their initial outputs (empty
+    timeline, hover text, subset placeholder) are already in get_tab().
+    """
 
     # 1) Build / update timeline
     @app.callback(
@@ -203,6 +226,7 @@ def register_callbacks(app: dash.Dash):
         Input("it-auto", "value"),
         Input("it-chart-type", "value"),
         Input("it-timescale", "value"),
+        prevent_initial_call=True,
     )
     def build_timeline(n_clicks, auto_val, chart_type, timescale):
         auto = auto_val and "auto" in auto_val
@@ -257,27 +281,23 @@ def register_callbacks(app: dash.Dash):
     @app.callback(
         Output("it-hover-info", "children"),
         Input("it-timeline", "hoverData"),
+        prevent_initial_call=True,
     )
     def display_hover(hover_data):
         if hover_data and hover_data.get("points"):
             pt = hover_data["points"][0]
             return f"{pt['x']}: {pt['y']} units"
-        return "Hover over a point or bar to see details."
+        return HOVER_PLACEHOLDER
 
     # 3) Update subset graph (brushed region)
     @app.callback(
         Output("it-subset", "figure"),
         Input("it-timeline", "selectedData"),
+        prevent_initial_call=True,
     )
     def update_subset(selected):
         if not selected or not selected.get("points"):
-            return go.Figure(
-                layout=dict(
-                    title="Select a range in the timeline above",
-                    xaxis_title="Date",
-                    yaxis_title="Signal Amplitude",
-                )
-            )
+            return _empty_subset_figure()
 
         xs = [p["x"] for p in selected["points"]]
         ys = [p["y"] for p in selected["points"]]
@@ -1,4 +1,6 @@
 import inspect
+from collections.abc import Mapping
+
 from dash import html
 
 from tabs_core.tab_menu_renderers import render_tab_menu
@@ -31,9 +33,9 @@ def menu_layout():
             "  - layout_content()"
         ) from e
 
-    if not isinstance(menu_meta, dict) or "items" not in menu_meta:
+    if not isinstance(menu_meta, Mapping) or "items" not in menu_meta:
         raise RuntimeError(
-            "TAB_MENU_META must be a dict containing an 'items' key"
+            "TAB_MENU_META must be a mapping containing an 'items' key"
         )
 
     return html.Div(
@@ -238,14 +238,35 @@ def render_section(section_id: str, title: str, content: list):
 # • Relies on a consistent DOM id contract
 # ============================================================
 
-from dash import Input, Output, State, callback_context
-from dash.exceptions import PreventUpdate
+from dash import Input, Output, State, ClientsideFunction
+
+
+def claim_callback_prefix(app, key: str) -> bool:
+    """
+    Record that callbacks for `key` are being registered on `app`.
+
+    Returns False (and prints a warning) if `key` was already claimed,
+    so callers can skip duplicate registration.
+    """
+    registered = getattr(app, "_registered_prefixes", None)
+    if registered is None:
+        registered = app._registered_prefixes = set()
+
+    if key in registered:
+        print(f"[CALLBACK WARNING] '{key}' callbacks already registered – skipped")
+        return False
+
+    registered.add(key)
+    return True
 
 
 def register_tab_menu_callbacks(app, tab_prefix: str):
     """
     Register hide / show callbacks for a tab tool menu.
 
+    The toggle runs clientside (assets/tab_menu.js → tabmenu.toggle):
+    it is pure UI state, so no request reaches the server.
+
     Parameters
     ----------
     app : dash.Dash
@@ -256,9 +277,16 @@ def register_tab_menu_callbacks(app, tab_prefix: str):
         Must match the ids used in render_tab_menu().
         Example:
             tab_prefix = "svc-lifecycle"
+
+    Idempotent per (app, tab_prefix): a second call is reported and
+    skipped instead of registering the same outputs twice.
     """
 
-    @app.callback(
+    if not claim_callback_prefix(app, f"tab-menu:{tab_prefix}"):
+        return
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="tabmenu", function_name="toggle"),
         Output(f"{tab_prefix}-menu", "style"),
         Output(f"{tab_prefix}-menu-show", "style"),
         Output(f"{tab_prefix}-menu-visible", "data"),
@@ -267,68 +295,3 @@ def register_tab_menu_callbacks(app, tab_prefix: str):
         State(f"{tab_prefix}-menu-visible", "data"),
         prevent_initial_call=True,
     )
-    def _toggle_tab_menu(hide_clicks, show_clicks, visible):
-        """
-        Toggle visibility of the tab menu.
-
-        Behavior:
-        • Hide button collapses the menu and reveals the show control
-        • Show button restores the menu
-        • State is stored in a dcc.Store (menu-visible)
-
-        Returns
-        -------
-        tuple:
-            (
-                menu_style: dict,
-                show_button_style: dict,
-                visible: bool
-            )
-        """
-
-        ctx = callback_context
-        if not ctx.triggered:
-            raise PreventUpdate
-
-        trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-        # ----------------------------------------------------
-        # HIDE MENU
-        # ----------------------------------------------------
-        if trigger_id.endswith("menu-hide"):
-            return (
-                {
-                    "visibility": "hidden",
-                    "opacity": 0,
-                    "pointerEvents": "none",
-                    "height": 0,
-                    "overflow": "hidden",
-                },
-                {
-                    "visibility": "visible",
-                    "opacity": 1,
-                    "pointerEvents": "auto",
-                },
-                False,
-            )
-
-        # ----------------------------------------------------
-        # SHOW MENU
-        # ----------------------------------------------------
-        if trigger_id.endswith("menu-show"):
-            return (
-                {
-                    "visibility": "visible",
-                    "opacity": 1,
-                    "pointerEvents": "auto",
-                    "height": "auto",
-                },
-                {
-                    "visibility": "hidden",
-                    "opacity": 0,
-                    "pointerEvents": "none",
-                },
-                True,
-            )
-
-        raise PreventUpdate
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+tab_types.py
+============================================================
+Typed tab metadata for Dash tab modules.
+
+TabMeta is a drop-in replacement for the TAB_META dict literal:
+- fixed fields, slotted and frozen (safe to share / use as a cache key)
+- keeps dict-style read access (meta["id"], meta.get("order", 999))
+  so the orchestrator in app.py works unchanged
+============================================================
+"""
+
+from dataclasses import asdict, dataclass, fields
+
+
+@dataclass(slots=True, frozen=True)
+class TabMeta:
+    id: str
+    label: str
+    type: str
+    order: int
+    workpackages: tuple[str, ...] = ()
+    categories: tuple[str, ...] = ()
+    subcategories: tuple[str, ...] = ()
+    version: str = ""
+    status: str = "active"
+
+    # --------------------------------------------------------
+    # Legacy dict-style access (TAB_META["id"], TAB_META.get(...))
+    # Only field names are keys: methods are never returned.
+    # --------------------------------------------------------
+    def __getitem__(self, key):
+        if key not in _TABMETA_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in _TABMETA_FIELDS:
+            return default
+        return getattr(self, key)
+
+    def as_dict(self):
+        return asdict(self)
+
+
+_TABMETA_FIELDS = frozenset(f.name for f in fields(TabMeta))